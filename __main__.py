@@ -1,6 +1,6 @@
 # File to solve sudoku in command line
 import numpy as np
-from stochasticsudokusolver import GeneticAlgorithm, SimulatedAnnealing, SAGA, BacktrackAlgorithm
+from stochasticsudokusolver import GeneticAlgorithm, SimulatedAnnealing, SAGA, BacktrackAlgorithm, TabuSearch, DancingLinks, PortfolioAlgorithm
 from stochasticsudokusolver import SudokuSolver
 
 if __name__ == "__main__":
@@ -97,14 +97,26 @@ if __name__ == "__main__":
     print('Puzzle is:')
     SudokuSolver.print_puzzle(puzzle)
     print('-------------')
+    number_of_solutions = DancingLinks().count_solutions(puzzle, limit=2)
+    if number_of_solutions == 0:
+        print('Puzzle has no solution. Exiting...')
+        exit()
+    elif number_of_solutions > 1:
+        print('Warning: puzzle has more than one solution.')
+        print('-------------')
     print('Choose algorithm:')
+    print('0. Auto (picks an algorithm for the puzzle)')
     print('1. Genetic Algorithm')
     print('2. Simulated Annealing')
     print('3. SAGA (Simulated Annealing Genetic Algorithm)')
     print('4. Backtracking Algorithm (brute force)')
-    print('5. Exit')
+    print('5. Tabu Search (min-conflicts)')
+    print('6. Dancing Links (exact)')
+    print('7. Exit')
     choice = int(input('Enter choice: '))
-    if choice == 1:
+    if choice == 0:
+        algorithm = PortfolioAlgorithm()
+    elif choice == 1:
         algorithm = GeneticAlgorithm()
     elif choice == 2:
         algorithm = SimulatedAnnealing()
@@ -113,6 +125,10 @@ if __name__ == "__main__":
         exit()
     elif choice == 4:
         algorithm = BacktrackAlgorithm()
+    elif choice == 5:
+        algorithm = TabuSearch()
+    elif choice == 6:
+        algorithm = DancingLinks()
     else:
         exit()
     print('Solving...')
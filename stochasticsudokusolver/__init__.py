@@ -1,3 +1,4 @@
 from .algorithms import *
 from .core import *
+from .tuning import *
 #
@@ -1,5 +1,8 @@
 from .backtrackalgorithm import BacktrackAlgorithm
+from .dancinglinks import DancingLinks
 from .geneticalgorithm import GeneticAlgorithm
+from .portfolioalgorithm import PortfolioAlgorithm
 from .saga import SAGA
 from .simulatedannealing import SimulatedAnnealing
-from .sudokualgorithm import SudokuAlgorithm
\ No newline at end of file
+from .sudokualgorithm import SudokuAlgorithm
+from .tabusearch import TabuSearch
\ No newline at end of file
@@ -0,0 +1,219 @@
+from .sudokualgorithm import SudokuAlgorithm
+import numpy as np
+from time import time
+
+
+class DancingLinks(SudokuAlgorithm):
+    """Exact solver using Knuth's Algorithm X with Dancing Links.
+
+    Sudoku is encoded as an exact cover problem with 729 candidate rows (a
+    digit in a cell) and 324 constraint columns (each cell, and each digit in
+    each row, column and block, must be covered exactly once). The links are
+    stored in flat lists indexed by node number instead of per-node objects:
+    node 0 is the root, nodes 1-324 are the column headers and candidate row
+    r owns the four nodes starting at 325 + 4*r.
+    """
+
+    NUM_COLUMNS = 324
+    FIRST_ROW_NODE = NUM_COLUMNS + 1
+
+    # Links of the full matrix, built on first use and shared by all instances,
+    # as every search works on its own copy
+    _template = None
+
+    def __init__(self, max_nodes: int = None):
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        self.completed = True
+
+    def __call__(self, sudoku: np.ndarray) -> np.ndarray:
+        start = time()
+        sudoku = np.array(sudoku, dtype=np.int8)
+        count, solution = self._search(sudoku, limit=1)
+        print("-----------------------------")
+        if count:
+            print(f"Solution found after {
+                  (time() - start)*1000:.2f} milliseconds using dancing links.")
+            return solution
+        if not self.completed:
+            print(f"No solution found within {self.nodes} nodes and {
+                  (time() - start)*1000:.2f} milliseconds using dancing links.")
+            return sudoku
+        print(f"No solution exists, checked in {
+              (time() - start)*1000:.2f} milliseconds using dancing links.")
+        return sudoku
+
+    def count_solutions(self, puzzle: np.ndarray, limit: int = 2) -> int:
+        """
+        Count the solutions of a puzzle, stopping early once `limit` solutions
+        have been found.
+
+        Parameters
+        ----------
+        puzzle : np.ndarray
+            Sudoku puzzle with shape (9, 9), with 0s as empty cells
+        limit : int
+            Maximum number of solutions to look for. The default of 2 is enough
+            to tell whether a puzzle has no, a unique or several solutions.
+            If the search is cut off by `max_nodes`, `completed` is set to
+            False and the count is only a lower bound.
+        """
+        count, _ = self._search(np.asarray(puzzle), limit)
+        return count
+
+    def has_unique_solution(self, puzzle: np.ndarray) -> bool:
+        """Return True if the puzzle has exactly one solution"""
+        return self.count_solutions(puzzle, limit=2) == 1
+
+    @staticmethod
+    def _candidate_columns(row: int, col: int, digit: int) -> tuple:
+        """Return the four constraint columns covered by a digit (0-8) in a cell"""
+        block = (row // 3) * 3 + col // 3
+        return (row*9 + col,
+                81 + row*9 + digit,
+                162 + col*9 + digit,
+                243 + block*9 + digit)
+
+    @classmethod
+    def _build_links(cls) -> tuple:
+        """Build the full, unreduced link structure of the 729 x 324 matrix"""
+        num_nodes = cls.FIRST_ROW_NODE + 4 * 729
+
+        # Column headers form a circular list through the root
+        left = list(range(-1, num_nodes - 1))
+        right = list(range(1, num_nodes + 1))
+        left[0] = cls.NUM_COLUMNS
+        right[cls.NUM_COLUMNS] = 0
+        up = list(range(num_nodes))
+        down = list(range(num_nodes))
+        column = list(range(num_nodes))
+        size = [0] * (cls.NUM_COLUMNS + 1)
+
+        for candidate in range(729):
+            row, col, digit = candidate // 81, candidate // 9 % 9, candidate % 9
+            first = cls.FIRST_ROW_NODE + 4 * candidate
+            for k, constraint in enumerate(
+                    cls._candidate_columns(row, col, digit)):
+                node = first + k
+                header = constraint + 1
+
+                # Each candidate row is a circular list of its four nodes
+                left[node] = first + (k - 1) % 4
+                right[node] = first + (k + 1) % 4
+
+                # Append the node to the bottom of its column
+                column[node] = header
+                up[node] = up[header]
+                down[node] = header
+                down[up[header]] = node
+                up[header] = node
+                size[header] += 1
+
+        return left, right, up, down, column, size
+
+    def _search(self, puzzle: np.ndarray, limit: int) -> tuple:
+        """Return the number of solutions found (at most `limit`) and the first
+        solution, or None if there is none. The number of search nodes visited
+        is stored in `nodes`, and `completed` is False if the search was cut
+        off by `max_nodes`."""
+        self.nodes = 0
+        self.completed = True
+        max_nodes = self.max_nodes if self.max_nodes is not None else np.inf
+        if DancingLinks._template is None:
+            DancingLinks._template = self._build_links()
+        left, right, up, down, column, size = (
+            list(links) for links in DancingLinks._template)
+        first_row_node = self.FIRST_ROW_NODE
+
+        def cover(header):
+            right[left[header]] = right[header]
+            left[right[header]] = left[header]
+            i = down[header]
+            while i != header:
+                j = right[i]
+                while j != i:
+                    down[up[j]] = down[j]
+                    up[down[j]] = up[j]
+                    size[column[j]] -= 1
+                    j = right[j]
+                i = down[i]
+
+        def uncover(header):
+            i = up[header]
+            while i != header:
+                j = left[i]
+                while j != i:
+                    size[column[j]] += 1
+                    down[up[j]] = j
+                    up[down[j]] = j
+                    j = left[j]
+                i = up[i]
+            right[left[header]] = header
+            left[right[header]] = header
+
+        # Select the rows of the given digits, rejecting contradicting givens
+        chosen = []
+        covered = set()
+        for row, col in np.argwhere(puzzle != 0).tolist():
+            candidate = row*81 + col*9 + int(puzzle[row, col]) - 1
+            node = first_row_node + 4 * candidate
+            headers = [column[node + k] for k in range(4)]
+            if covered.intersection(headers):
+                return 0, None
+            covered.update(headers)
+            for header in headers:
+                cover(header)
+            chosen.append(node)
+
+        count = 0
+        nodes = 0
+        solution = None
+
+        def search():
+            nonlocal count, nodes, solution
+            nodes += 1
+            if right[0] == 0:
+                count += 1
+                if solution is None:
+                    solution = list(chosen)
+                return
+
+            # Branch on the column with the fewest remaining candidates
+            header = right[0]
+            best = size[header]
+            c = right[header]
+            while c != 0 and best > 1:
+                if size[c] < best:
+                    header, best = c, size[c]
+                c = right[c]
+            if best == 0:
+                return
+
+            cover(header)
+            r = down[header]
+            while r != header and count < limit and nodes < max_nodes:
+                chosen.append(r)
+                j = right[r]
+                while j != r:
+                    cover(column[j])
+                    j = right[j]
+                search()
+                j = left[r]
+                while j != r:
+                    uncover(column[j])
+                    j = left[j]
+                chosen.pop()
+                r = down[r]
+            uncover(header)
+
+        search()
+        self.nodes = nodes
+        self.completed = count >= limit or nodes < max_nodes
+
+        if solution is None:
+            return count, None
+        board = np.zeros((9, 9), dtype=np.int8)
+        for node in solution:
+            candidate = (node - first_row_node) // 4
+            board[candidate // 81, candidate // 9 % 9] = candidate % 9 + 1
+        return count, board
@@ -12,6 +12,8 @@ class GeneticAlgorithm(SudokuAlgorithm):
                  max_generations: int = 20000,
                  individual_mutation_rate: float = 0.65,
                  restart_after_n_generations: int = 200,
+                 max_seconds: float = None,
+                 conflict_guided: bool = False,
                  ):
 
         self.so = so  # Dependency injection
@@ -21,6 +23,8 @@ class GeneticAlgorithm(SudokuAlgorithm):
         self.max_generations = max_generations
         self.individual_mutation_rate = individual_mutation_rate
         self.restart_after_n_generations = restart_after_n_generations
+        self.max_seconds = max_seconds
+        self.conflict_guided = conflict_guided
         self.fitness_history = []
 
     def __call__(self, sudoku: np.ndarray, show_live_plot: bool = False,
@@ -29,6 +33,8 @@ class GeneticAlgorithm(SudokuAlgorithm):
         sudoku = np.array(sudoku, dtype=np.int8)
 
         start_time = time()
+        deadline = (start_time + self.max_seconds
+                    if self.max_seconds is not None else np.inf)
 
         if show_live_plot:
             pass  # TODO: Implement live plot
@@ -46,12 +52,14 @@ class GeneticAlgorithm(SudokuAlgorithm):
         current_generation = self.so.create_initial_population_bounded(
             puzzle=sudoku, population_size=self.population_size)
 
-        # Main loop
-        while iteration < self.max_generations and not found_solution:
+        # Main loop, which always runs at least one generation so that a board
+        # can be returned even if the time limit is reached during the setup
+        while (iteration < self.max_generations and not found_solution and
+               (iteration == 0 or time() < deadline)):
 
             # Calculate fitness
             fitness = self.so.get_fitness(current_generation, fixed_indices)
-            fitness_indices = np.argsort(fitness)
+            fitness_indices = self.so.rank_population(fitness)
 
             # Store best fitness
             self.fitness_history.append(fitness[fitness_indices[0]])
@@ -93,9 +101,16 @@ class GeneticAlgorithm(SudokuAlgorithm):
                 current_generation, children_amount)
             next_generation[selection_amount:] = children
 
-            # Mutate the next generation
-            next_generation = self.so.mutate_sudoku_population_bounded(
-                next_generation, fixed_indices, self.individual_mutation_rate)
+            # Mutate the next generation, optionally preferring to swap cells
+            # with conflicts
+            if self.conflict_guided:
+                next_generation = self.so.mutate_sudoku_population_guided(
+                    next_generation, fixed_indices,
+                    self.individual_mutation_rate)
+            else:
+                next_generation = self.so.mutate_sudoku_population_bounded(
+                    next_generation, fixed_indices,
+                    self.individual_mutation_rate)
 
             # Update current generation
             current_generation = next_generation
@@ -0,0 +1,177 @@
+from stochasticsudokusolver.core.utils.stochasticoperations import StochasticOperations
+from stochasticsudokusolver.algorithms.sudokualgorithm import SudokuAlgorithm
+from stochasticsudokusolver.algorithms.dancinglinks import DancingLinks
+from stochasticsudokusolver.algorithms.geneticalgorithm import GeneticAlgorithm
+from stochasticsudokusolver.algorithms.simulatedannealing import SimulatedAnnealing
+import numpy as np
+import json
+from time import time
+
+
+class PortfolioAlgorithm(SudokuAlgorithm):
+    """Picks an engine for each puzzle instead of leaving it to the user.
+
+    Puzzles that constraint propagation alone solves or proves unsolvable are
+    answered directly. Otherwise the exact solver runs under a node budget,
+    which is enough for almost every puzzle. When the budget runs out, the
+    stochastic algorithms are tried in turn and share a time budget. Cheap
+    puzzle features, the engine that succeeded and the time taken are appended
+    to `history`, so that the budgets can be tuned on a real workload.
+    """
+
+    def __init__(
+            self,
+            so: StochasticOperations = StochasticOperations(),
+            node_budget: int = 10000,
+            time_budget: float = 60.0,
+            stochastic_algorithms: list = None,
+    ):
+
+        self.so = so  # Dependency injection
+
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+        self.exact_algorithm = DancingLinks(max_nodes=node_budget)
+        if stochastic_algorithms is None:
+            stochastic_algorithms = [
+                SimulatedAnnealing(so=so, conflict_guided=True),
+                GeneticAlgorithm(so=so, conflict_guided=True),
+            ]
+
+        # The time budget is passed on through max_seconds
+        for algorithm in stochastic_algorithms:
+            if not hasattr(algorithm, "max_seconds"):
+                raise ValueError(f"{type(algorithm).__name__} has no time "
+                                 f"limit (max_seconds) and cannot be used as "
+                                 f"a stochastic algorithm")
+        self.stochastic_algorithms = stochastic_algorithms
+        self.history = []
+
+    def __call__(self, sudoku: np.ndarray) -> np.ndarray:
+        sudoku = np.array(sudoku, dtype=np.int8)
+
+        start_time = time()
+        propagated, candidate_counts = self.propagate(sudoku)
+        record = {
+            "features": self._features(sudoku, propagated, candidate_counts),
+            "nodes": 0,
+        }
+        solution, engine = self._route(sudoku, propagated, record, start_time)
+        record["engine"] = engine
+        record["seconds"] = time() - start_time
+        self.history.append(record)
+
+        print("-----------------------------")
+        if engine is not None:
+            print(f"Portfolio used {engine} after {record['seconds']:.2f}"
+                  f" seconds.")
+        else:
+            print(f"Portfolio found no solution after {record['seconds']:.2f}"
+                  f" seconds.")
+        return solution
+
+    def _route(self, sudoku: np.ndarray, propagated: np.ndarray, record: dict,
+               start_time: float) -> tuple:
+        """Return the solution and the name of the engine that found it, or
+        the puzzle and None if no engine succeeded"""
+        fixed_indices = self.so.get_fixed_indices(sudoku)
+
+        # A propagated board with an empty cell without candidates, or with a
+        # repeated digit, means that the puzzle has no solution
+        if record["features"]["contradiction"]:
+            return sudoku, None
+        if record["features"]["empty_after_propagation"] == 0:
+            if self.so.get_fitness(propagated[None], fixed_indices)[0] != 0:
+                return sudoku, None
+            return propagated, "Propagation"
+
+        # Try the exact solver under the node budget
+        self.exact_algorithm.max_nodes = self.node_budget
+        solution = self.exact_algorithm(sudoku)
+        record["nodes"] = self.exact_algorithm.nodes
+        if self.exact_algorithm.completed:
+            if np.all(solution != 0):
+                return solution, type(self.exact_algorithm).__name__
+            return sudoku, None
+
+        # Escalate to the stochastic algorithms as the node budget ran out,
+        # splitting the remaining time evenly between them. Once no time is
+        # left, the remaining algorithms are skipped.
+        deadline = start_time + self.time_budget
+        for i, algorithm in enumerate(self.stochastic_algorithms):
+            remaining_algorithms = len(self.stochastic_algorithms) - i
+            max_seconds = (deadline - time()) / remaining_algorithms
+            if max_seconds <= 0:
+                break
+
+            # Lend the time limit to the algorithm, which may belong to the
+            # caller, and restore its own limit afterwards
+            previous_max_seconds = algorithm.max_seconds
+            algorithm.max_seconds = max_seconds
+            try:
+                solution = algorithm(sudoku)
+            finally:
+                algorithm.max_seconds = previous_max_seconds
+
+            if self.so.get_fitness(solution[None], fixed_indices)[0] == 0:
+                return solution, type(algorithm).__name__
+        return sudoku, None
+
+    @staticmethod
+    def propagate(sudoku: np.ndarray) -> tuple:
+        """Repeatedly fill in cells that have only one candidate left (naked
+        singles). Return the resulting board and the number of candidates of
+        each of its cells, which is 0 for filled cells."""
+        board = np.array(sudoku, dtype=np.int8)
+        while True:
+            # Digits used per row, column and block, shape (9, 9, 9)
+            one_hot = board[..., None] == np.arange(1, 10)
+            in_row = one_hot.any(axis=1)[:, None, :]
+            in_col = one_hot.any(axis=0)[None, :, :]
+            in_block = one_hot.reshape(3, 3, 3, 3, 9).any(axis=(1, 3))
+            in_block = np.repeat(np.repeat(in_block, 3, axis=0), 3, axis=1)
+
+            candidates = (~(in_row | in_col | in_block) &
+                          (board == 0)[..., None])
+            candidate_counts = candidates.sum(axis=2)
+            singles = (board == 0) & (candidate_counts == 1)
+            if not np.any(singles):
+                return board, candidate_counts
+            board[singles] = np.argmax(candidates[singles], axis=1) + 1
+
+    @classmethod
+    def get_features(cls, sudoku: np.ndarray) -> dict:
+        """
+        Extract cheap features of a puzzle used for routing, with candidates
+        counted after propagation.
+
+        Returns
+        -------
+        dict
+            Number of clues, number of empty cells and mean number of
+            candidates per empty cell after propagation, whether propagation
+            left a cell without candidates, and the smallest and largest number
+            of clues in a block.
+        """
+        sudoku = np.array(sudoku, dtype=np.int8)
+        return cls._features(sudoku, *cls.propagate(sudoku))
+
+    @staticmethod
+    def _features(sudoku: np.ndarray, propagated: np.ndarray,
+                  candidate_counts: np.ndarray) -> dict:
+        block_clues = (sudoku != 0).reshape(3, 3, 3, 3).sum(axis=(1, 3))
+        empty = propagated == 0
+        return {
+            "clues": int(np.sum(sudoku != 0)),
+            "empty_after_propagation": int(np.sum(empty)),
+            "mean_candidates": (float(candidate_counts[empty].mean())
+                                if np.any(empty) else 0.0),
+            "contradiction": bool(np.any(candidate_counts[empty] == 0)),
+            "min_block_clues": int(block_clues.min()),
+            "max_block_clues": int(block_clues.max()),
+        }
+
+    def export_history(self, path: str) -> None:
+        """Write the recorded features, engines and timings to a JSON file"""
+        with open(path, "w") as file:
+            json.dump(self.history, file, indent=4)
@@ -11,6 +11,8 @@ class SimulatedAnnealing(SudokuAlgorithm):
             final_temperature: float = 0.01,
             end_after_n_restarts: int = 10,
             restart_after_n_reheats: int = 3,
+            max_seconds: float = None,
+            conflict_guided: bool = False,
     ):
 
         self.so = so  # Dependency injection
@@ -18,6 +20,8 @@ class SimulatedAnnealing(SudokuAlgorithm):
         self.final_temperature = final_temperature
         self.end_after_n_restarts = end_after_n_restarts
         self.restart_after_n_reheats = restart_after_n_reheats
+        self.max_seconds = max_seconds
+        self.conflict_guided = conflict_guided
         self.energy_history = []
 
     def __call__(self, sudoku: np.ndarray, show_live_plot: bool = False,
@@ -26,6 +30,8 @@ class SimulatedAnnealing(SudokuAlgorithm):
         sudoku = np.array(sudoku, dtype=np.int8)
 
         start_time = time()
+        deadline = (start_time + self.max_seconds
+                    if self.max_seconds is not None else np.inf)
 
         if show_live_plot:  # TODO: Implement live plot
             pass
@@ -53,9 +59,12 @@ class SimulatedAnnealing(SudokuAlgorithm):
         # Initialize solution
         solution = np.empty((9, 9), dtype=np.int8)
 
-        # Outer loop for restarts
+        # Outer loop for restarts, which always creates at least one population
+        # so that a board can be returned even if the time limit is reached
+        # during the setup
         while (restart_counts < self.end_after_n_restarts and
-               not found_solution):
+               not found_solution and
+               (restart_counts == 0 or time() < deadline)):
 
             # Create initial population
             current_populaion = self.so.create_initial_population_bounded(
@@ -69,17 +78,23 @@ class SimulatedAnnealing(SudokuAlgorithm):
             reheats = 0
 
             # Inner loop for Simulated Annealing
-            while temperature > self.final_temperature and not found_solution:
+            while (temperature > self.final_temperature and
+                   not found_solution and time() < deadline):
 
                 # Check if solution is found
                 if self.energy_history[-1] == 0:
                     found_solution = True
                     solution = current_populaion[np.argmin(current_energies)]
 
-                # Create new population
+                # Create new population, optionally preferring to swap cells
+                # with conflicts
                 number_of_swaps = np.random.randint(1, 4)
-                new_population = self.so.get_neighbors(
-                    current_populaion, fixed_indices, number_of_swaps)
+                if self.conflict_guided:
+                    new_population = self.so.get_neighbors_guided(
+                        current_populaion, fixed_indices, number_of_swaps)
+                else:
+                    new_population = self.so.get_neighbors(
+                        current_populaion, fixed_indices, number_of_swaps)
 
                 # Calculate new population energies
                 new_energies = self.so.get_fitness(
@@ -129,7 +144,7 @@ class SimulatedAnnealing(SudokuAlgorithm):
             restart_counts += 1
 
             # Check if restart is needed
-            if (not found_solution and
+            if (not found_solution and time() < deadline and
                     restart_counts < self.end_after_n_restarts):
 
                 print(f"Restarting population {
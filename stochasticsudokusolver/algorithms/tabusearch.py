@@ -0,0 +1,191 @@
+from stochasticsudokusolver.core.utils.stochasticoperations import StochasticOperations
+from stochasticsudokusolver.algorithms.sudokualgorithm import SudokuAlgorithm
+import numpy as np
+from time import time
+
+
+class TabuSearch(SudokuAlgorithm):
+    """Conflict-directed local search (min-conflicts with a tabu list).
+
+    Every block of the board is kept as a permutation of 1-9, so the cost is
+    the number of digits missing from the rows and columns. Each iteration only
+    considers in-block swaps that involve at least one conflicting cell and
+    makes the best swap that is not tabu, using per-row and per-column digit
+    counts to evaluate the cost change of a swap in constant time.
+    """
+
+    def __init__(
+            self,
+            so: StochasticOperations = StochasticOperations(),
+            max_iterations: int = 100000,
+            tabu_tenure: int = 10,
+            restart_after_n_iterations: int = 2000,
+            max_seconds: float = None,
+    ):
+
+        self.so = so  # Dependency injection
+
+        self.max_iterations = max_iterations
+        self.tabu_tenure = tabu_tenure
+        self.restart_after_n_iterations = restart_after_n_iterations
+        self.max_seconds = max_seconds
+        self.cost_history = []
+
+    def __call__(self, sudoku: np.ndarray) -> np.ndarray:
+        self.cost_history = []
+        sudoku = np.array(sudoku, dtype=np.int8)
+
+        start_time = time()
+        deadline = (start_time + self.max_seconds
+                    if self.max_seconds is not None else np.inf)
+
+        # Free cells grouped by block, as swaps are only made within a block
+        free_cells = [
+            [(block_row*3 + i, block_col*3 + j)
+             for i, j in np.ndindex(3, 3)
+             if sudoku[block_row*3 + i, block_col*3 + j] == 0]
+            for block_row, block_col in np.ndindex(3, 3)
+        ]
+
+        # Initialize variables
+        iteration = 0
+        restarts = 0
+        found_solution = False
+
+        board, row_counts, col_counts, cost, tabu_until = self._restart(sudoku)
+        best_board = board.copy()
+        best_cost = cost
+        last_improvement = 0
+        self.cost_history.append(cost)
+
+        # Main loop
+        while (iteration < self.max_iterations and not found_solution and
+               time() < deadline):
+
+            # Check if solution is found
+            if cost == 0:
+                found_solution = True
+                break
+
+            # Find the best admissible swap involving a conflicting cell
+            best_delta = None
+            best_moves = []
+            for cells in free_cells:
+                for a in range(len(cells)):
+                    r1, c1 = cells[a]
+                    v1 = board[r1, c1]
+                    conflicting = (row_counts[r1, v1] > 1 or
+                                   col_counts[c1, v1] > 1)
+                    for b in range(a + 1, len(cells)):
+                        r2, c2 = cells[b]
+                        v2 = board[r2, c2]
+                        if not (conflicting or row_counts[r2, v2] > 1 or
+                                col_counts[c2, v2] > 1):
+                            continue
+
+                        delta = self._swap_delta(
+                            row_counts, col_counts, r1, c1, v1, r2, c2, v2)
+
+                        # Tabu moves are only allowed if they improve on the
+                        # best cost found so far (aspiration criterion)
+                        tabu = (tabu_until[r1, c1, v2] > iteration or
+                                tabu_until[r2, c2, v1] > iteration)
+                        if tabu and cost + delta >= best_cost:
+                            continue
+
+                        if best_delta is None or delta < best_delta:
+                            best_delta = delta
+                            best_moves = [(r1, c1, r2, c2)]
+                        elif delta == best_delta:
+                            best_moves.append((r1, c1, r2, c2))
+
+            # Make the chosen swap, breaking ties randomly
+            if best_moves:
+                r1, c1, r2, c2 = best_moves[np.random.randint(len(best_moves))]
+                v1, v2 = board[r1, c1], board[r2, c2]
+                self._apply_swap(board, row_counts, col_counts,
+                                 r1, c1, v1, r2, c2, v2)
+                tabu_until[r1, c1, v1] = iteration + self.tabu_tenure
+                tabu_until[r2, c2, v2] = iteration + self.tabu_tenure
+                cost += best_delta
+
+            self.cost_history.append(cost)
+
+            if cost < best_cost:
+                best_cost = cost
+                best_board = board.copy()
+                last_improvement = iteration
+
+            # Restart if stuck on a plateau
+            elif (not best_moves or iteration - last_improvement >=
+                    self.restart_after_n_iterations):
+                restarts += 1
+                print(f"Restarting search {restarts} after {iteration}"
+                      f" iterations at cost {cost}.")
+                board, row_counts, col_counts, cost, tabu_until = (
+                    self._restart(sudoku))
+                last_improvement = iteration
+
+            # Increment iteration
+            iteration += 1
+
+            # Print progress
+            if iteration % 2000 == 0:
+                print("-----------------------------")
+                print(f"current iteration: {iteration} \
+                    \ncurrent cost: {cost} \
+                    \nbest cost: {best_cost} \
+                    \nelapsed time: {time() - start_time:.2f}")
+
+        if found_solution:
+            print("-----------------------------")
+            print(f"\nSolution found after {iteration} iterations and {
+                  time() - start_time:.2f} seconds.")
+            return board
+        else:
+            print("-----------------------------")
+            print(f"\nNo solution found after {iteration} iterations and {
+                  time() - start_time:.2f} seconds.")
+            print('Returning best solution found.')
+            return best_board
+
+    def _restart(self, sudoku: np.ndarray) -> tuple:
+        """Create a new random board together with its digit counts, cost and
+        an empty tabu list"""
+        board = self.so.create_initial_solution_bounded(sudoku)
+        row_counts = np.zeros((9, 10), dtype=np.int8)
+        col_counts = np.zeros((9, 10), dtype=np.int8)
+        for i in range(9):
+            row_counts[i] = np.bincount(board[i], minlength=10)
+            col_counts[i] = np.bincount(board[:, i], minlength=10)
+        cost = int(np.sum(row_counts[:, 1:] == 0) +
+                   np.sum(col_counts[:, 1:] == 0))
+        tabu_until = np.zeros((9, 9, 10), dtype=np.int64)
+        return board, row_counts, col_counts, cost, tabu_until
+
+    @staticmethod
+    def _swap_delta(row_counts, col_counts, r1, c1, v1, r2, c2, v2) -> int:
+        """Return the change in cost from swapping v1 at (r1, c1) with v2 at
+        (r2, c2). The cost of a row or column is its number of missing digits."""
+        delta = 0
+        if r1 != r2:
+            # Row r1 loses v1 and gains v2, row r2 loses v2 and gains v1
+            delta += (int(row_counts[r1, v1] == 1) - int(row_counts[r1, v2] == 0) +
+                      int(row_counts[r2, v2] == 1) - int(row_counts[r2, v1] == 0))
+        if c1 != c2:
+            delta += (int(col_counts[c1, v1] == 1) - int(col_counts[c1, v2] == 0) +
+                      int(col_counts[c2, v2] == 1) - int(col_counts[c2, v1] == 0))
+        return delta
+
+    @staticmethod
+    def _apply_swap(board, row_counts, col_counts, r1, c1, v1, r2, c2, v2):
+        """Swap two cells of the board and update the digit counts in place"""
+        board[r1, c1], board[r2, c2] = v2, v1
+        row_counts[r1, v1] -= 1
+        row_counts[r1, v2] += 1
+        row_counts[r2, v2] -= 1
+        row_counts[r2, v1] += 1
+        col_counts[c1, v1] -= 1
+        col_counts[c1, v2] += 1
+        col_counts[c2, v2] -= 1
+        col_counts[c2, v1] += 1
@@ -1 +1,2 @@
-from .stochasticoperations import StochasticOperations
\ No newline at end of file
+from .stochasticoperations import StochasticOperations
+from .profiledoperations import ProfiledStochasticOperations
\ No newline at end of file
@@ -0,0 +1,168 @@
+from stochasticsudokusolver.core.utils.stochasticoperations import StochasticOperations
+import numpy as np
+import json
+import tracemalloc
+from time import perf_counter_ns
+
+
+class ProfiledStochasticOperations(StochasticOperations):
+    """StochasticOperations wrapper that records call counts, timings and
+    memory use for each hot-path operator.
+
+    Pass an instance through the `so` parameter of an algorithm to enable
+    profiling. The plain StochasticOperations stays the default, so nothing is
+    measured (and nothing is slowed down) unless this class is injected.
+
+    By default only the size of the arrays an operator returns is recorded.
+    With `track_allocations=True`, tracemalloc (which also sees NumPy
+    temporaries) records the peak memory allocated during each call. This
+    slows down every call, so timings are best taken with it turned off. If
+    this instance started tracemalloc, call `stop` when done (or use the
+    instance as a context manager) so the rest of the process is not traced.
+    """
+
+    PROFILED_OPERATIONS = (
+        "get_fitness",
+        "rank_population",
+        "create_children",
+        "mutate_sudoku_population_bounded",
+        "mutate_sudoku_population_guided",
+        "get_neighbors",
+        "get_neighbors_guided",
+        "accept_population",
+        "create_initial_population_bounded",
+    )
+
+    def __init__(self, so: StochasticOperations = None,
+                 track_allocations: bool = False):
+        self.so = so if so is not None else StochasticOperations()
+        self.track_allocations = track_allocations
+        self._started_tracing = (track_allocations and
+                                 not tracemalloc.is_tracing())
+        if self._started_tracing:
+            tracemalloc.start()
+        self.reset()
+
+        # Forward every operator to the wrapped instance, so that subclasses of
+        # StochasticOperations can be profiled as well
+        for name in dir(self.so):
+            if not name.startswith("_") and callable(getattr(self.so, name)):
+                setattr(self, name, getattr(self.so, name))
+
+        # Shadow the hot-path operators of this instance with timed versions
+        for name in self.PROFILED_OPERATIONS:
+            setattr(self, name, self._profile(name, getattr(self.so, name)))
+
+    def stop(self) -> None:
+        """Stop tracemalloc if this instance started it. The measurements are
+        kept, but no further allocations are recorded."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def reset(self) -> None:
+        """Clear all recorded measurements"""
+        self.timings = {name: [] for name in self.PROFILED_OPERATIONS}
+        self.returned_bytes = {name: 0 for name in self.PROFILED_OPERATIONS}
+        self.allocated_bytes = {name: [] for name in self.PROFILED_OPERATIONS}
+
+    def _profile(self, name: str, operation):
+        def profiled_operation(*args, **kwargs):
+            start = perf_counter_ns()
+            result = operation(*args, **kwargs)
+            self.timings[name].append(perf_counter_ns() - start)
+            self.returned_bytes[name] += self._nbytes(result)
+            return result
+
+        def allocation_tracked_operation(*args, **kwargs):
+            if not tracemalloc.is_tracing():
+                return profiled_operation(*args, **kwargs)
+            tracemalloc.reset_peak()
+            memory_before, _ = tracemalloc.get_traced_memory()
+            result = profiled_operation(*args, **kwargs)
+            _, peak_memory = tracemalloc.get_traced_memory()
+            self.allocated_bytes[name].append(peak_memory - memory_before)
+            return result
+
+        wrapper = (allocation_tracked_operation if self.track_allocations
+                   else profiled_operation)
+        wrapper.__name__ = name
+        wrapper.__doc__ = operation.__doc__
+        return wrapper
+
+    @staticmethod
+    def _nbytes(result) -> int:
+        """Return the number of bytes held by the arrays returned by an operator"""
+        if isinstance(result, np.ndarray):
+            return result.nbytes
+        if isinstance(result, tuple):
+            return sum(r.nbytes for r in result if isinstance(r, np.ndarray))
+        return 0
+
+    def report(self) -> dict:
+        """
+        Summarize the recorded measurements per operator.
+
+        Returns
+        -------
+        dict
+            Maps operator name to a dict with the call count, cumulative time,
+            mean, median, 95th and 99th percentile time (all in milliseconds)
+            and the total size in bytes of the returned arrays. With
+            allocation tracking, also the sum and maximum over calls of the
+            peak bytes allocated during a call. Operators that were never
+            called are left out.
+        """
+        report = {}
+        for name in self.PROFILED_OPERATIONS:
+            timings = self.timings[name]
+            if not timings:
+                continue
+            timings_ms = np.array(timings) / 1e6
+            p50, p95, p99 = np.percentile(timings_ms, [50, 95, 99])
+            report[name] = {
+                "calls": len(timings),
+                "total_ms": float(timings_ms.sum()),
+                "mean_ms": float(timings_ms.mean()),
+                "p50_ms": float(p50),
+                "p95_ms": float(p95),
+                "p99_ms": float(p99),
+                "returned_bytes": int(self.returned_bytes[name]),
+            }
+            if self.track_allocations:
+                report[name]["allocated_bytes"] = int(
+                    np.sum(self.allocated_bytes[name]))
+                report[name]["peak_allocated_bytes"] = int(
+                    np.max(self.allocated_bytes[name]))
+        return report
+
+    def print_report(self) -> None:
+        """Print the measurements as a table, sorted by cumulative time"""
+        report = self.report()
+        print("-----------------------------")
+        header = (f"{'operator':<34}{'calls':>8}{'total ms':>11}{'p50 ms':>9}"
+                  f"{'p95 ms':>9}{'p99 ms':>9}{'out MiB':>9}")
+        if self.track_allocations:
+            header += f"{'alloc MiB':>11}{'peak MiB':>10}"
+        print(header)
+        for name, stats in sorted(report.items(),
+                                  key=lambda item: -item[1]["total_ms"]):
+            row = (f"{name:<34}{stats['calls']:>8}{stats['total_ms']:>11.1f}"
+                   f"{stats['p50_ms']:>9.3f}{stats['p95_ms']:>9.3f}"
+                   f"{stats['p99_ms']:>9.3f}"
+                   f"{stats['returned_bytes'] / 2**20:>9.1f}")
+            if self.track_allocations:
+                row += (f"{stats['allocated_bytes'] / 2**20:>11.1f}"
+                        f"{stats['peak_allocated_bytes'] / 2**20:>10.2f}")
+            print(row)
+
+    def export_report(self, path: str) -> None:
+        """Write the measurements to a JSON file"""
+        with open(path, "w") as file:
+            json.dump(self.report(), file, indent=4)
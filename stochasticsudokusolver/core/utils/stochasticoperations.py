@@ -3,6 +3,10 @@ import numpy as np
 
 class StochasticOperations:
 
+    # Weight of a cell without conflicts when sampling cells to swap in the
+    # conflict-guided operators, so that such cells are still picked sometimes
+    CONFLICT_FREE_WEIGHT = 0.1
+
     @staticmethod
     def get_fixed_indices(puzzle: np.ndarray) -> np.ndarray:
         """Return the indices of fixed values in the puzzle"""
@@ -55,6 +59,38 @@ class StochasticOperations:
 
         return fitness
 
+    @staticmethod
+    def get_conflicts(population: np.ndarray) -> np.ndarray:
+        """
+        Count for every cell the number of other cells in its row and column
+        holding the same value.
+
+        Parameters
+        ----------
+        population : np.ndarray
+            Population of filled Sudoku boards with shape (num_individuals, 9, 9)
+
+        Returns
+        -------
+        np.ndarray
+            Conflict counts with shape (num_individuals, 9, 9)
+        """
+        # Digit counts per row and per column, shape (num_individuals, 9, 9)
+        one_hot = population[..., None] == np.arange(1, 10)
+        row_counts = one_hot.sum(axis=2, dtype=np.int8)
+        col_counts = one_hot.sum(axis=1, dtype=np.int8)
+
+        values = population.astype(np.intp) - 1
+        cell_row_counts = np.take_along_axis(row_counts, values, axis=2)
+        cell_col_counts = np.take_along_axis(
+            col_counts, values.transpose(0, 2, 1), axis=2).transpose(0, 2, 1)
+        return cell_row_counts + cell_col_counts - 2
+
+    @staticmethod
+    def rank_population(fitness: np.ndarray) -> np.ndarray:
+        """Return the indices of the population sorted from most to least fit"""
+        return np.argsort(fitness)
+
     @staticmethod
     def create_initial_solution(puzzle: np.ndarray) -> np.ndarray:
         """Create a random solution from the given puzzle"""
@@ -181,6 +217,72 @@ class StochasticOperations:
                            ] = new_population[:, [i_new, i], [j_new, j]]
         return new_population
 
+    @staticmethod
+    def _sample_indices(weights: np.ndarray) -> np.ndarray:
+        """Sample one column index per row of weights, with probability
+        proportional to the weights"""
+        cumulative_weights = np.cumsum(weights, axis=1)
+        thresholds = np.random.rand(weights.shape[0]) * cumulative_weights[:, -1]
+        return np.argmax(cumulative_weights > thresholds[:, None], axis=1)
+
+    @classmethod
+    def swap_conflicting_cells(cls, population: np.ndarray, fixed_indices: np.ndarray) -> np.ndarray:
+        """Swap two non-fixed cells within a block of each board, choosing cells with
+            probability proportional to their number of row and column conflicts
+        """
+        num_individuals = population.shape[0]
+        block_ids = (np.arange(9)[:, None] // 3) * 3 + np.arange(9) // 3
+        free = np.ones((9, 9), dtype=bool)
+        free[fixed_indices[:, 0], fixed_indices[:, 1]] = False
+
+        # Only cells in blocks with at least two free cells can be swapped
+        free_per_block = np.bincount(block_ids[free], minlength=9)
+        swappable = (free & (free_per_block[block_ids] >= 2)).ravel()
+        new_population = population.copy()
+        if num_individuals == 0 or not np.any(swappable):
+            return new_population
+
+        weights = (cls.get_conflicts(population).reshape(num_individuals, 81)
+                   + cls.CONFLICT_FREE_WEIGHT) * swappable
+        first = cls._sample_indices(weights)
+
+        # Pick the second cell from the other swappable cells in the same block
+        block_ids = block_ids.ravel()
+        weights *= block_ids == block_ids[first][:, None]
+        individuals = np.arange(num_individuals)
+        weights[individuals, first] = 0
+        second = cls._sample_indices(weights)
+
+        # Swap the values in the new population
+        flat_population = new_population.reshape(num_individuals, 81)
+        flat_population[individuals, first], flat_population[individuals, second] = (
+            flat_population[individuals, second], flat_population[individuals, first])
+        return new_population
+
+    @classmethod
+    def mutate_sudoku_population_guided(cls, population: np.ndarray, fixed_indices: np.ndarray, mutation_rate: float, number_of_swaps=3) -> np.ndarray:
+        """Mutate a population of Sudoku arrays with a given mutation rate.
+            Like mutate_sudoku_population_bounded, but cells with row and column conflicts
+            are more likely to be swapped
+        """
+        mutate_mask = np.random.rand(population.shape[0]) < mutation_rate
+        new_population = population.copy()
+        mutants = population[mutate_mask]
+        for _ in range(np.random.randint(0, number_of_swaps)):
+            mutants = cls.swap_conflicting_cells(mutants, fixed_indices)
+        new_population[mutate_mask] = mutants
+        return new_population
+
+    @classmethod
+    def get_neighbors_guided(cls, current_population: np.ndarray, fixed_indices: np.ndarray, number_of_swaps: int = 2):
+        """Create a new population by swapping cells within blocks, preferring cells with
+        row and column conflicts, except for fixed indices."""
+        new_population = current_population.copy()
+        for _ in range(number_of_swaps):
+            new_population = cls.swap_conflicting_cells(
+                new_population, fixed_indices)
+        return new_population
+
     @staticmethod
     def accept_population(current_population: np.ndarray,
                           new_population: np.ndarray,
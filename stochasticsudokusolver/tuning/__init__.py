@@ -0,0 +1 @@
+from .successivehalving import SuccessiveHalvingTuner, load_profile, make_corpus
\ No newline at end of file
@@ -0,0 +1,231 @@
+from stochasticsudokusolver import algorithms
+from stochasticsudokusolver.algorithms.sudokualgorithm import SudokuAlgorithm
+from stochasticsudokusolver.core.utils.stochasticoperations import StochasticOperations
+from stochasticsudokusolver.misc import sudoku_examples
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+import numpy as np
+import io
+import json
+from time import time
+
+
+def _evaluate(algorithm_name: str, parameters: dict, puzzle: np.ndarray,
+              seed: int, max_seconds: float) -> tuple:
+    """Solve a puzzle once with the given configuration and return the time
+    taken and whether the returned board is a correct solution"""
+    np.random.seed(seed)
+    algorithm = getattr(algorithms, algorithm_name)(
+        max_seconds=max_seconds, **parameters)
+    puzzle = np.array(puzzle, dtype=np.int8)
+
+    start = time()
+    with redirect_stdout(io.StringIO()):
+        solution = algorithm(puzzle)
+    seconds = time() - start
+
+    so = StochasticOperations()
+    fitness = so.get_fitness(solution[None], so.get_fixed_indices(puzzle))
+    solved = (fitness[0] == 0 and
+              np.all(solution[puzzle != 0] == puzzle[puzzle != 0]))
+    return seconds, bool(solved)
+
+
+def make_corpus(puzzles_per_difficulty: int = 10, seed: int = 0) -> dict:
+    """
+    Create a seeded corpus from the example puzzles by applying random
+    validity-preserving transformations (relabelling digits, permuting rows
+    within bands, columns within stacks, bands, stacks, and transposing), which
+    keep the difficulty of a puzzle unchanged.
+
+    Returns
+    -------
+    dict
+        Maps 'easy', 'medium', 'hard' and 'evil' to lists of puzzles
+    """
+    rng = np.random.default_rng(seed)
+    corpus = {}
+    for difficulty in ["easy", "medium", "hard", "evil"]:
+        puzzle = np.array(getattr(sudoku_examples, difficulty), dtype=np.int8)
+        puzzles = [puzzle]
+        while len(puzzles) < puzzles_per_difficulty:
+            digits = np.concatenate(([0], rng.permutation(9) + 1))
+            rows = np.concatenate([band * 3 + rng.permutation(3)
+                                   for band in rng.permutation(3)])
+            cols = np.concatenate([stack * 3 + rng.permutation(3)
+                                   for stack in rng.permutation(3)])
+            transformed = digits[puzzle][rows][:, cols].astype(np.int8)
+            if rng.random() < 0.5:
+                transformed = transformed.T.copy()
+            puzzles.append(transformed)
+        corpus[difficulty] = puzzles
+    return corpus
+
+
+class SuccessiveHalvingTuner:
+    """Hyperparameter tuner for the stochastic algorithms using successive
+    halving.
+
+    A number of configurations are sampled from the search space of the
+    algorithm and raced on a puzzle corpus. Every rung, each surviving
+    configuration is run on more (puzzle, seed) pairs and only the best 1/eta
+    of them, by mean time-to-solve, go on to the next rung. Runs that do not
+    solve the puzzle within `max_seconds` are scored as `unsolved_penalty`
+    times `max_seconds`. Runs are spread over worker processes.
+    """
+
+    # Parameter name -> (low, high, type, sample on log scale)
+    SEARCH_SPACES = {
+        "GeneticAlgorithm": {
+            "population_size": (100, 2000, int, True),
+            "selection_rate": (0.05, 0.5, float, False),
+            "individual_mutation_rate": (0.2, 1.0, float, False),
+            "restart_after_n_generations": (50, 500, int, True),
+        },
+        "SimulatedAnnealing": {
+            "final_temperature": (0.002, 0.05, float, True),
+            "end_after_n_restarts": (2, 30, int, True),
+            "restart_after_n_reheats": (0, 8, int, False),
+        },
+    }
+
+    def __init__(
+            self,
+            algorithm: str = "GeneticAlgorithm",
+            num_configurations: int = 27,
+            eta: int = 3,
+            min_runs: int = 2,
+            max_seconds: float = 10.0,
+            unsolved_penalty: float = 2.0,
+            processes: int = None,
+            seed: int = 0,
+    ):
+        if algorithm not in self.SEARCH_SPACES:
+            raise ValueError(f"No search space for algorithm {algorithm}, "
+                             f"choose one of {list(self.SEARCH_SPACES)}")
+        if eta < 2:
+            raise ValueError(f"eta must be at least 2, got {eta}")
+        if min_runs < 1:
+            raise ValueError(f"min_runs must be at least 1, got {min_runs}")
+        if num_configurations < 1:
+            raise ValueError(f"num_configurations must be at least 1, "
+                             f"got {num_configurations}")
+
+        self.algorithm = algorithm
+        self.num_configurations = num_configurations
+        self.eta = eta
+        self.min_runs = min_runs
+        self.max_seconds = max_seconds
+        self.unsolved_penalty = unsolved_penalty
+        self.processes = processes
+        self.seed = seed
+
+    def sample_configurations(self, rng: np.random.Generator) -> list:
+        """Sample configurations uniformly (or log-uniformly) from the search
+        space. The first configuration is always the algorithm's defaults."""
+        configurations = [{}]
+        space = self.SEARCH_SPACES[self.algorithm]
+        for _ in range(self.num_configurations - 1):
+            configuration = {}
+            for name, (low, high, type_, log) in space.items():
+                if log:
+                    value = np.exp(rng.uniform(np.log(low), np.log(high)))
+                else:
+                    value = rng.uniform(low, high)
+                configuration[name] = (int(round(value)) if type_ is int
+                                       else float(value))
+            configurations.append(configuration)
+        return configurations
+
+    def tune(self, corpus: dict) -> dict:
+        """
+        Tune the algorithm separately for each difficulty of the corpus.
+
+        Parameters
+        ----------
+        corpus : dict
+            Maps a difficulty name to a list of puzzles of shape (9, 9)
+
+        Returns
+        -------
+        dict
+            Maps each difficulty to the best configuration found, with its
+            parameters, mean score in seconds, solve rate and number of runs.
+        """
+        return {difficulty: self.tune_difficulty(puzzles)
+                for difficulty, puzzles in corpus.items()}
+
+    def tune_difficulty(self, puzzles: list) -> dict:
+        """Race sampled configurations on a list of puzzles and return the
+        best one"""
+        rng = np.random.default_rng(self.seed)
+        configurations = self.sample_configurations(rng)
+        scores = [[] for _ in configurations]
+        solved = [[] for _ in configurations]
+
+        survivors = list(range(len(configurations)))
+        runs = self.min_runs
+        with ProcessPoolExecutor(max_workers=self.processes) as executor:
+            while True:
+                # Run k of every configuration uses the same puzzle and seed,
+                # so that configurations are compared on equal terms
+                futures = {}
+                for index in survivors:
+                    for k in range(len(scores[index]), runs):
+                        futures[(index, k)] = executor.submit(
+                            _evaluate, self.algorithm, configurations[index],
+                            puzzles[k % len(puzzles)], self.seed + k,
+                            self.max_seconds)
+                for (index, k), future in sorted(futures.items()):
+                    seconds, is_solved = future.result()
+                    scores[index].append(
+                        seconds if is_solved
+                        else self.unsolved_penalty * self.max_seconds)
+                    solved[index].append(is_solved)
+
+                # Keep the best 1/eta, and stop once a single configuration is
+                # left, as there is nothing to compare it with any more
+                survivors.sort(key=lambda index: np.mean(scores[index]))
+                survivors = survivors[:max(1, len(survivors) // self.eta)]
+                if len(survivors) <= 1:
+                    break
+
+                # Give the survivors eta times as many runs
+                runs *= self.eta
+
+        best = survivors[0]
+        return {
+            "parameters": configurations[best],
+            "mean_seconds": float(np.mean(scores[best])),
+            "solved_rate": float(np.mean(solved[best])),
+            "runs": len(scores[best]),
+        }
+
+    def save_profile(self, results: dict, path: str) -> None:
+        """Write the tuning results to a JSON profile that can be read with
+        load_profile"""
+        with open(path, "w") as file:
+            json.dump({"algorithm": self.algorithm, "profiles": results},
+                      file, indent=4)
+
+
+def load_profile(path: str, difficulty: str, **kwargs) -> SudokuAlgorithm:
+    """
+    Create an algorithm configured with the tuned parameters for a difficulty.
+
+    Parameters
+    ----------
+    path : str
+        Path to a profile written by SuccessiveHalvingTuner.save_profile
+    difficulty : str
+        Difficulty of the profile to use, e.g. 'hard'
+    **kwargs
+        Extra arguments for the algorithm, overriding the profile
+    """
+    with open(path) as file:
+        profile = json.load(file)
+    if difficulty not in profile["profiles"]:
+        raise KeyError(f"No profile for difficulty {difficulty}, "
+                       f"choose one of {list(profile['profiles'])}")
+    parameters = {**profile["profiles"][difficulty]["parameters"], **kwargs}
+    return getattr(algorithms, profile["algorithm"])(**parameters)
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from stochasticsudokusolver import DancingLinks
+from stochasticsudokusolver.misc import sudoku_examples
+
+
+def test_empty_grid_reaches_limit():
+    assert DancingLinks().count_solutions(np.zeros((9, 9)), limit=50) == 50
+
+
+def test_clashing_givens_have_no_solution():
+    puzzle = np.array(sudoku_examples.easy)
+    puzzle[0, 2] = puzzle[0, 0]
+    assert DancingLinks().count_solutions(puzzle) == 0
+
+
+@pytest.mark.parametrize("difficulty", ["easy", "medium", "hard", "evil"])
+def test_examples_have_unique_solution(difficulty):
+    puzzle = np.array(getattr(sudoku_examples, difficulty))
+    dancing_links = DancingLinks()
+
+    assert dancing_links.count_solutions(puzzle) == 1
+    assert dancing_links.has_unique_solution(puzzle)
+
+
+def test_removing_clues_gives_several_solutions():
+    puzzle = np.array(sudoku_examples.easy)
+    puzzle[[0, 0, 1, 8, 7, 6], [0, 1, 0, 8, 8, 7]] = 0
+    dancing_links = DancingLinks()
+
+    assert dancing_links.count_solutions(puzzle, limit=100) > 1
+    assert not dancing_links.has_unique_solution(puzzle)
+
+
+def test_node_budget_cuts_off_search():
+    dancing_links = DancingLinks(max_nodes=5)
+    dancing_links.count_solutions(np.array(sudoku_examples.hard))
+
+    assert not dancing_links.completed
+    assert dancing_links.nodes <= 5
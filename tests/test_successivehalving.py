@@ -0,0 +1,14 @@
+import pytest
+from stochasticsudokusolver import SuccessiveHalvingTuner
+
+
+@pytest.mark.parametrize("arguments", [
+    {"algorithm": "TabuSearch"},
+    {"eta": 1},
+    {"eta": 0},
+    {"min_runs": 0},
+    {"num_configurations": 0},
+])
+def test_invalid_arguments_are_rejected(arguments):
+    with pytest.raises(ValueError):
+        SuccessiveHalvingTuner(**arguments)
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from stochasticsudokusolver import (BacktrackAlgorithm, GeneticAlgorithm,
+                                    PortfolioAlgorithm, SimulatedAnnealing,
+                                    TabuSearch)
+from stochasticsudokusolver.misc import sudoku_examples
+
+
+@pytest.mark.parametrize("algorithm", [GeneticAlgorithm, SimulatedAnnealing,
+                                       TabuSearch])
+@pytest.mark.parametrize("max_seconds", [0.0, 0.01])
+def test_tiny_time_budget_returns_board(algorithm, max_seconds):
+    """A time limit that runs out during the setup still returns a board"""
+    puzzle = np.array(sudoku_examples.hard, dtype=np.int8)
+    solution = algorithm(max_seconds=max_seconds)(puzzle)
+
+    assert solution.shape == (9, 9)
+    assert np.all(solution[puzzle != 0] == puzzle[puzzle != 0])
+    assert np.all(solution != 0)
+
+
+@pytest.mark.parametrize("time_budget", [0.0, 0.3])
+def test_portfolio_escalation_within_tiny_time_budget(time_budget):
+    """Escalating with little or no time left gives up instead of failing,
+    and leaves the time limits of the caller's algorithms untouched"""
+    puzzle = np.array(sudoku_examples.hard, dtype=np.int8)
+    stochastic_algorithms = [SimulatedAnnealing(max_seconds=5.0),
+                             GeneticAlgorithm()]
+    portfolio = PortfolioAlgorithm(node_budget=1, time_budget=time_budget,
+                                   stochastic_algorithms=stochastic_algorithms)
+    portfolio(puzzle)
+
+    assert portfolio.history[-1]["engine"] in (None, "SimulatedAnnealing",
+                                               "GeneticAlgorithm")
+    assert stochastic_algorithms[0].max_seconds == 5.0
+    assert stochastic_algorithms[1].max_seconds is None
+
+
+def test_portfolio_rejects_algorithms_without_time_limit():
+    with pytest.raises(ValueError):
+        PortfolioAlgorithm(stochastic_algorithms=[BacktrackAlgorithm(),
+                                                  TabuSearch()])